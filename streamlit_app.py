@@ -1,9 +1,8 @@
 import streamlit as st
 from docx import Document
 from docx.shared import Pt, Cm
-from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+from docx.oxml.ns import qn, nsdecls
+from docx.oxml import OxmlElement, parse_xml
 import io
 from datetime import datetime
 import re
@@ -11,6 +10,7 @@ import zipfile
 import logging
 import html
 import math
+from functools import lru_cache
 
 # --- Setup Logging, Constants, and Utility Functions ---
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -18,6 +18,38 @@ logger = logging.getLogger(__name__)
 
 INDENT_FOR_IND_TAG_CM = 1.25
 
+# List indents in twips: text starts 0.8cm further in per level, label hangs 0.8cm to its left.
+_LIST_LEFT_TWIPS = (Cm(0.8).twips, Cm(1.6).twips, Cm(2.4).twips)
+_LIST_HANGING_TWIPS = Cm(0.8).twips
+_LIST_NUM_ID = 1
+# Two-column 'Table Grid' table as python-docx builds it for the default template (8640 twips text width).
+_TABLE_XML = (
+    '<w:tbl><w:tblPr><w:tblStyle w:val="TableGrid"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" w:noHBand="0" w:noVBand="1" w:val="04A0"/>'
+    '</w:tblPr><w:tblGrid><w:gridCol w:w="4320"/><w:gridCol w:w="4320"/></w:tblGrid>{rows}</w:tbl>'
+)
+_TABLE_ROW_XML = (
+    '<w:tr><w:tc><w:tcPr><w:tcW w:type="dxa" w:w="4320"/></w:tcPr><w:p><w:r>{0}</w:r></w:p></w:tc>'
+    '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="4320"/></w:tcPr><w:p><w:r>{1}</w:r></w:p></w:tc></w:tr>'
+)
+_RUN_BREAK_RE = re.compile(r'(\t|\r|\n)')
+# Font and size come from the Normal style (Arial 11pt), so runs only carry bold/underline.
+_RUN_XML = '<w:r><w:rPr>{bold}{underline}</w:rPr>{text}</w:r>'
+_NUMPR_XML = tuple(
+    f'<w:numPr><w:ilvl w:val="{level}"/><w:numId w:val="{_LIST_NUM_ID}"/></w:numPr>'
+    for level in range(3)
+)
+_NORMAL_FONT_SIZE = Pt(11)
+_SPACE_6PT_TWIPS = Pt(6).twips
+_SPACE_12PT_TWIPS = Pt(12).twips
+_IND_TAG_TWIPS = Cm(INDENT_FOR_IND_TAG_CM).twips
+
+_TAG_RE = re.compile(r'^\[(?P<close>/?)(?P<name>indiv|corp|[au][1-4])\]$')
+_FMT_TAGS = ('<bd>', '</bd>', '<ins>', '</ins>')
+_LIST_TYPE_BY_PREFIX = {'<a>': 'letter', '<i>': 'roman'}
+_LIST_MARKER_RE = re.compile(r'^(<[ai]>|\d+\.)\s*')
+
+@lru_cache(maxsize=256)
 def sanitize_input(text):
     if not isinstance(text, str): text = str(text)
     return html.escape(text)
@@ -53,6 +85,21 @@ def load_precedent_text():
         logger.error(f"Error loading precedent.txt: {e}")
         return ""
 
+class PlaceholderMap(dict):
+    """Placeholder values keyed by name, with one compiled pattern matching every {name}."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.braced = {'{' + k + '}': str(v) for k, v in self.items()}
+        self.pattern = re.compile('|'.join(map(re.escape, self.braced)) or r'(?!)')
+
+    def _replace(self, match):
+        value = self.braced[match.group(0)]
+        logger.debug("Replacing placeholder %s with %s", match.group(0), value)
+        return value
+
+    def substitute(self, text):
+        return self.pattern.sub(self._replace, text)
+
 def get_placeholder_map(app_inputs, firm_details):
     placeholders = {
         'qu1_dispute_nature': app_inputs.get('qu1_dispute_nature', ''),
@@ -72,31 +119,76 @@ def get_placeholder_map(app_inputs, firm_details):
     }
     firm_placeholders = {k: str(v) for k, v in firm_details.items()}
     placeholders.update(firm_placeholders)
-    logger.info(f"Placeholder map created: {placeholders}")
-    return placeholders
-
-def add_formatted_runs(paragraph, text_line, placeholder_map):
-    processed_text = text_line
-    for placeholder, value in placeholder_map.items():
-        placeholder_pattern = f"{{{placeholder}}}"
-        if placeholder_pattern in processed_text:
-            logger.info(f"Replacing placeholder {placeholder_pattern} with {value}")
-        processed_text = processed_text.replace(placeholder_pattern, str(value))
-    parts = re.split(r'(<bd>|</bd>|<ins>|</ins>)', processed_text)
+    return PlaceholderMap(placeholders)
+
+def _iter_formatted(text):
+    """Yield (segment, is_bold, is_underline) for each stretch of text between <bd>/<ins> tags."""
     is_bold = is_underline = False
-    for part in parts:
-        if not part: continue
-        if part == "<bd>": is_bold = True
-        elif part == "</bd>": is_bold = False
-        elif part == "<ins>": is_underline = True
-        elif part == "</ins>": is_underline = False
-        else:
-            for i, line_part in enumerate(part.split('\n')):
-                if i > 0: paragraph.add_run().add_break()
-                run = paragraph.add_run(line_part)
-                run.bold, run.underline = is_bold, is_underline
-                run.font.name, run.font.size = 'Arial', Pt(11)
-                logger.debug(f"Added run: {line_part}, bold={is_bold}, underline={is_underline}")
+    start = pos = 0
+    while True:
+        pos = text.find('<', pos)
+        if pos == -1:
+            break
+        tag = next((t for t in _FMT_TAGS if text.startswith(t, pos)), None)
+        if tag is None:
+            pos += 1
+            continue
+        if pos > start:
+            yield text[start:pos], is_bold, is_underline
+        if tag == '<bd>': is_bold = True
+        elif tag == '</bd>': is_bold = False
+        elif tag == '<ins>': is_underline = True
+        else: is_underline = False
+        pos = start = pos + len(tag)
+    if start < len(text):
+        yield text[start:], is_bold, is_underline
+
+def _run_text_xml(text):
+    """Run content for text, mapping tabs and line breaks the way python-docx's run.text does."""
+    xml = []
+    for part in _RUN_BREAK_RE.split(str(text)):
+        if part == '\t':
+            xml.append('<w:tab/>')
+        elif part in ('\r', '\n'):
+            xml.append('<w:br/>')
+        elif part:
+            space = ' xml:space="preserve"' if part.strip() != part else ''
+            xml.append(f'<w:t{space}>{html.escape(part, quote=False)}</w:t>')
+    return ''.join(xml)
+
+def formatted_runs_xml(run_segments, placeholder_map):
+    xml = []
+    for seg, is_bold, is_underline in run_segments:
+        seg = placeholder_map.substitute(seg)
+        bold = '<w:b/>' if is_bold else '<w:b w:val="0"/>'
+        underline = '<w:u w:val="single"/>' if is_underline else '<w:u w:val="none"/>'
+        line_parts = seg.split('\n') if '\n' in seg else (seg,)
+        for i, line_part in enumerate(line_parts):
+            if i > 0: xml.append('<w:r><w:br/></w:r>')
+            xml.append(_RUN_XML.format(bold=bold, underline=underline, text=_run_text_xml(line_part)))
+            logger.debug("Added run: %s, bold=%s, underline=%s", line_part, is_bold, is_underline)
+    return ''.join(xml)
+
+def paragraph_xml(runs_xml, num_level=None, space_before=None, space_after=None, left_indent=None, justify=False):
+    """<w:p> markup with the pPr children python-docx would write, in schema order. Measurements are in twips."""
+    ppr = []
+    if num_level is not None:
+        ppr.append(_NUMPR_XML[num_level])
+    if space_before is not None or space_after is not None:
+        spacing = ''.join(f' w:{k}="{v}"' for k, v in (('before', space_before), ('after', space_after)) if v is not None)
+        ppr.append(f'<w:spacing{spacing}/>')
+    if left_indent is not None:
+        ppr.append(f'<w:ind w:left="{left_indent}"/>')
+    if justify:
+        ppr.append('<w:jc w:val="both"/>')
+    ppr_xml = f'<w:pPr>{"".join(ppr)}</w:pPr>' if ppr else ''
+    return f'<w:p>{ppr_xml}{runs_xml}</w:p>'
+
+def append_body_xml(doc, parts):
+    """Parse the paragraph/table markup in parts once and insert it ahead of the closing <w:sectPr>."""
+    fragment = parse_xml(f'<w:body {nsdecls("w")}>{"".join(parts)}</w:body>')
+    body = doc.element.body
+    body[len(body) - 1:len(body) - 1] = list(fragment)
 
 def should_render_track_block(tag, claim_assigned, selected_track):
     tag_map = {
@@ -109,43 +201,42 @@ def should_render_track_block(tag, claim_assigned, selected_track):
     if not expected: return False
     return claim_assigned == expected[0] and selected_track == expected[1]
 
-def generate_initial_advice_doc(app_inputs, placeholder_map):
+def new_document():
     doc = Document()
-    doc.styles['Normal'].font.name, doc.styles['Normal'].font.size = 'Arial', Pt(11)
-    p = doc.add_paragraph()
-    add_formatted_runs(p, "Initial Advice Summary - Matter Number: {matter_number}", placeholder_map)
-    p.paragraph_format.space_after = Pt(12)
-    table = doc.add_table(rows=3, cols=2)
-    table.style = 'Table Grid'
+    normal_font = doc.styles['Normal'].font
+    normal_font.name, normal_font.size = 'Arial', _NORMAL_FONT_SIZE
+    return doc
+
+def grid_table_xml(rows_data):
+    """<w:tbl> markup for a two-column table of (label, value) rows."""
+    rows = ''.join(_TABLE_ROW_XML.format(_run_text_xml(label), _run_text_xml(value)) for label, value in rows_data)
+    return _TABLE_XML.format(rows=rows)
+
+@st.cache_data(max_entries=16)
+def generate_initial_advice_doc(app_inputs, placeholder_map):
+    doc = new_document()
+    title_runs = formatted_runs_xml(_iter_formatted("Initial Advice Summary - Matter Number: {matter_number}"), placeholder_map)
     rows_data = [
         ("Date of Advice", app_inputs['initial_advice_date'].strftime('%d/%m/%Y') if app_inputs.get('initial_advice_date') else ''),
         ("Method of Advice", app_inputs.get('initial_advice_method', '')),
         ("Advice Given", app_inputs.get('initial_advice_content', ''))
     ]
-    for i, (label, value) in enumerate(rows_data):
-        table.rows[i].cells[0].text, table.rows[i].cells[1].text = label, value
+    append_body_xml(doc, [paragraph_xml(title_runs, space_after=_SPACE_12PT_TWIPS), grid_table_xml(rows_data)])
     doc_io = io.BytesIO()
     doc.save(doc_io)
-    doc_io.seek(0)
-    return doc_io
+    return doc_io.getvalue()
 
-def preprocess_precedent(precedent_content, app_inputs):
+@st.cache_data
+def preprocess_precedent(precedent_content):
     logical_elements = []
-    lines = precedent_content.splitlines()
-    i = 0
     current_block_tag = None
     block_lines = []
     current_list_type = None  # Track list type: 'numbered', 'letter', 'roman'
 
-    def determine_list_type(line):
-        line = line.strip()
-        if line.startswith('<a>'):
-            return 'letter'
-        elif line.startswith('<i>'):
-            return 'roman'
-        elif line.startswith('1.'):
+    def determine_list_type(stripped):
+        if stripped[:2] == '1.':
             return 'numbered'
-        return None
+        return _LIST_TYPE_BY_PREFIX.get(stripped[:3])
 
     def flush_block(block_tag, block_lines, list_type):
         if not block_lines:
@@ -154,69 +245,70 @@ def preprocess_precedent(precedent_content, app_inputs):
         if not content:
             logical_elements.append({'type': 'blank_line', 'content_lines': [], 'block_tag': block_tag, 'list_type': None})
         elif '<ins>' in content:
-            logical_elements.append({'type': 'heading', 'content_lines': block_lines, 'block_tag': block_tag, 'list_type': None})
+            logical_elements.append({'type': 'heading', 'content_lines': block_lines, 'block_tag': block_tag, 'list_type': None,
+                                     'run_segments': list(_iter_formatted(block_lines[0]))})
         elif '[FEE_TABLE_PLACEHOLDER]' in content:
             logical_elements.append({'type': 'fee_table', 'content_lines': block_lines, 'block_tag': block_tag, 'list_type': None})
         else:
             element_type = list_type or 'general_paragraph'
+            if list_type:
+                cleaned_content = _LIST_MARKER_RE.sub('', block_lines[0]).strip()
+            else:
+                cleaned_content = block_lines[0].replace('[ind]', '').strip()
             logical_elements.append({
                 'type': element_type,
                 'content_lines': block_lines,
                 'block_tag': block_tag,
-                'list_type': list_type
+                'list_type': list_type,
+                'run_segments': list(_iter_formatted(cleaned_content))
             })
 
-    while i < len(lines):
-        line = lines[i].strip()
-        match_start_tag = re.match(r'^\[(indiv|corp|a[1-4]|u[1-4])\]$', line)
-        match_end_tag = re.match(r'^\[/(indiv|corp|a[1-4]|u[1-4])\]$', line)
-        if match_start_tag:
+    for raw in io.StringIO(precedent_content):
+        raw = raw.rstrip('\n')
+        stripped = raw.strip()
+        match_tag = _TAG_RE.match(stripped)
+        if match_tag and not match_tag.group('close'):
             if block_lines and current_block_tag is None:
                 flush_block(None, block_lines, current_list_type)
                 block_lines = []
-            current_block_tag = match_start_tag.group(1)
-            i += 1
-            continue
-        elif match_end_tag:
-            if block_lines and current_block_tag == match_end_tag.group(1):
+            current_block_tag = match_tag.group('name')
+        elif match_tag:
+            if block_lines and current_block_tag == match_tag.group('name'):
                 flush_block(current_block_tag, block_lines, current_list_type)
                 block_lines = []
             current_block_tag = None
             current_list_type = None
-            i += 1
-            continue
-        else:
-            if line:
-                new_list_type = determine_list_type(line)
-                if new_list_type and new_list_type != current_list_type:
-                    if block_lines:
-                        flush_block(current_block_tag, block_lines, current_list_type)
-                        block_lines = []
-                    current_list_type = new_list_type
-                block_lines.append(lines[i])
-            else:
+        elif stripped:
+            new_list_type = determine_list_type(stripped)
+            if new_list_type and new_list_type != current_list_type:
                 if block_lines:
                     flush_block(current_block_tag, block_lines, current_list_type)
                     block_lines = []
-                logical_elements.append({'type': 'blank_line', 'content_lines': [], 'block_tag': current_block_tag, 'list_type': None})
-            i += 1
+                current_list_type = new_list_type
+            block_lines.append(raw)
+        else:
+            if block_lines:
+                flush_block(current_block_tag, block_lines, current_list_type)
+                block_lines = []
+            logical_elements.append({'type': 'blank_line', 'content_lines': [], 'block_tag': current_block_tag, 'list_type': None})
 
     if block_lines:
         flush_block(current_block_tag, block_lines, current_list_type)
 
     return logical_elements
 
+@st.cache_data(max_entries=16)
 def process_precedent_text(precedent_content, app_inputs, placeholder_map):
     try:
-        doc = Document()
-        doc.styles['Normal'].font.name, doc.styles['Normal'].font.size = 'Arial', Pt(11)
+        logical_elements = preprocess_precedent(precedent_content)
+        doc = new_document()
         numbering_elm = doc.part.numbering_part.element
-        abstract_num_id, num_instance_id = 10, 1
+        abstract_num_id, num_instance_id = 10, _LIST_NUM_ID
 
         abstract_num = OxmlElement('w:abstractNum')
         abstract_num.set(qn('w:abstractNumId'), str(abstract_num_id))
 
-        def create_level(ilvl, numFmt, lvlText, left_indent_cm, hanging_cm, start_val=1):
+        def create_level(ilvl, numFmt, lvlText, left_twips, hanging_twips, start_val=1):
             lvl = OxmlElement('w:lvl')
             lvl.set(qn('w:ilvl'), str(ilvl))
             numFmt_el = OxmlElement('w:numFmt')
@@ -230,18 +322,18 @@ def process_precedent_text(precedent_content, app_inputs, placeholder_map):
             lvl.append(start_el)
             pPr = OxmlElement('w:pPr')
             ind = OxmlElement('w:ind')
-            ind.set(qn('w:left'), str(Cm(left_indent_cm).twips))
-            ind.set(qn('w:hanging'), str(Cm(hanging_cm).twips))
+            ind.set(qn('w:left'), str(left_twips))
+            ind.set(qn('w:hanging'), str(hanging_twips))
             pPr.append(ind)
             lvl.append(pPr)
             return lvl
 
         # Level 0: Numbered list (1.), text at 0.8cm, hanging 0.8cm (label at 0cm)
-        abstract_num.append(create_level(0, 'decimal', '%1.', 0.8, 0.8, start_val=1))
+        abstract_num.append(create_level(0, 'decimal', '%1.', _LIST_LEFT_TWIPS[0], _LIST_HANGING_TWIPS, start_val=1))
         # Level 1: Letter list (a.), text at 1.6cm, hanging 0.8cm (label at 0.8cm)
-        abstract_num.append(create_level(1, 'lowerLetter', '%2.', 1.6, 0.8, start_val=1))
+        abstract_num.append(create_level(1, 'lowerLetter', '%2.', _LIST_LEFT_TWIPS[1], _LIST_HANGING_TWIPS, start_val=1))
         # Level 2: Roman list (i.), text at 2.4cm, hanging 0.8cm (label at 1.6cm)
-        abstract_num.append(create_level(2, 'lowerRoman', '%3.', 2.4, 0.8, start_val=1))
+        abstract_num.append(create_level(2, 'lowerRoman', '%3.', _LIST_LEFT_TWIPS[2], _LIST_HANGING_TWIPS, start_val=1))
         numbering_elm.append(abstract_num)
 
         num = OxmlElement('w:num')
@@ -251,7 +343,7 @@ def process_precedent_text(precedent_content, app_inputs, placeholder_map):
         num.append(abstract_num_id_ref)
         numbering_elm.append(num)
 
-        logical_elements = preprocess_precedent(precedent_content, app_inputs)
+        body_parts = []
         for element in logical_elements:
             render_this_element = True
             tag = element.get('block_tag')
@@ -266,25 +358,16 @@ def process_precedent_text(precedent_content, app_inputs, placeholder_map):
                 continue
 
             content = element['content_lines'][0] if element['content_lines'] else ""
-            logger.debug(f"Processing element: {element['type']}, content: {content}")
-
-            def add_list_item(level, text):
-                p = doc.add_paragraph()
-                pPr = p._p.get_or_add_pPr()
-                numPr = pPr.get_or_add_numPr()
-                numPr.get_or_add_ilvl().val = level
-                numPr.get_or_add_numId().val = num_instance_id
-                cleaned_content = re.sub(r'^(<[ai]>|\d+\.)\s*', '', text).strip()
-                add_formatted_runs(p, cleaned_content, placeholder_map)
-                p.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
-                p.paragraph_format.space_after = Pt(6)
-                logger.info(f"Added list item at level {level}: {cleaned_content}")
+            logger.debug("Processing element: %s, content: %s", element['type'], content)
+
+            def add_list_item(level, run_segments):
+                runs_xml = formatted_runs_xml(run_segments, placeholder_map)
+                body_parts.append(paragraph_xml(runs_xml, num_level=level, space_after=_SPACE_6PT_TWIPS, justify=True))
+                logger.debug("Added list item at level %s: %s", level, content)
 
             if element['type'] == 'blank_line':
                 continue
             elif element['type'] == 'fee_table':
-                table = doc.add_table(rows=5, cols=2)
-                table.style = 'Table Grid'
                 fee_data = [
                     ("Grade A", "£450 (Partners, Solicitors over 8 years)"),
                     ("Grade B", "£350 (Solicitors/Legal Executives over 4 years)"),
@@ -292,30 +375,25 @@ def process_precedent_text(precedent_content, app_inputs, placeholder_map):
                     ("Grade D", "£250 (Trainees, Paralegals)"),
                     ("Grade E", "£150 (Support Staff)")
                 ]
-                for i, (grade, rate) in enumerate(fee_data):
-                    table.rows[i].cells[0].text = grade
-                    table.rows[i].cells[1].text = rate
-                doc.add_paragraph().paragraph_format.space_after = Pt(12)
+                body_parts.append(grid_table_xml(fee_data))
+                body_parts.append(paragraph_xml('', space_after=_SPACE_12PT_TWIPS))
             elif element['type'] == 'heading':
-                p = doc.add_paragraph()
-                add_formatted_runs(p, content, placeholder_map)
-                p.paragraph_format.space_before = Pt(12)
-                p.paragraph_format.space_after = Pt(6)
+                runs_xml = formatted_runs_xml(element['run_segments'], placeholder_map)
+                body_parts.append(paragraph_xml(runs_xml, space_before=_SPACE_12PT_TWIPS, space_after=_SPACE_6PT_TWIPS))
             elif element['type'] == 'numbered':
-                add_list_item(0, content)
+                add_list_item(0, element['run_segments'])
             elif element['type'] == 'letter':
-                add_list_item(1, content)
+                add_list_item(1, element['run_segments'])
             elif element['type'] == 'roman':
-                add_list_item(2, content)
+                add_list_item(2, element['run_segments'])
             elif element['type'] == 'general_paragraph':
-                p = doc.add_paragraph()
-                cleaned_content = content.replace('[ind]', '').strip()
-                if '[ind]' in content:
-                    p.paragraph_format.left_indent = Cm(INDENT_FOR_IND_TAG_CM)
-                add_formatted_runs(p, cleaned_content, placeholder_map)
-                p.paragraph_format.alignment = WD_PARAGRAPH_ALIGNMENT.JUSTIFY
-                p.paragraph_format.space_after = Pt(12)
-        return doc
+                runs_xml = formatted_runs_xml(element['run_segments'], placeholder_map)
+                left_indent = _IND_TAG_TWIPS if '[ind]' in content else None
+                body_parts.append(paragraph_xml(runs_xml, space_after=_SPACE_12PT_TWIPS, left_indent=left_indent, justify=True))
+        append_body_xml(doc, body_parts)
+        doc_io = io.BytesIO()
+        doc.save(doc_io)
+        return doc_io.getvalue()
     except Exception as e:
         logger.error(f"Error processing precedent text: {e}", exc_info=True)
         raise
@@ -410,20 +488,17 @@ if submitted:
     }
     placeholder_map = get_placeholder_map(app_inputs, firm_details)
     try:
-        doc = process_precedent_text(precedent_content, app_inputs, placeholder_map)
-        client_care_doc_io = io.BytesIO()
-        doc.save(client_care_doc_io)
-        client_care_doc_io.seek(0)
+        client_care_doc = process_precedent_text(precedent_content, app_inputs, placeholder_map)
         
-        advice_doc_io = generate_initial_advice_doc(app_inputs, placeholder_map)
+        advice_doc = generate_initial_advice_doc(app_inputs, placeholder_map)
         
         client_name_safe = re.sub(r'[^\w\s-]', '', client_name_input).strip().replace(' ', '_')
         zip_io = io.BytesIO()
         
-        with zipfile.ZipFile(zip_io, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            zipf.writestr(f"Client_Care_Letter_{client_name_safe}.docx", client_care_doc_io.getvalue())
-            if advice_doc_io:
-                zipf.writestr(f"Initial_Advice_Summary_{client_name_safe}.docx", advice_doc_io.getvalue())
+        with zipfile.ZipFile(zip_io, 'w', zipfile.ZIP_STORED) as zipf:
+            zipf.writestr(f"Client_Care_Letter_{client_name_safe}.docx", client_care_doc)
+            if advice_doc:
+                zipf.writestr(f"Initial_Advice_Summary_{client_name_safe}.docx", advice_doc)
         
         zip_io.seek(0)
         